@@ -717,6 +717,9 @@ def _(x: fractions.Fraction, exponent: int = 0):
     if not math.isfinite(x):
         raise ValueError("Input must be finite")
 
+    # The sign bit could also be read from the bit representation, as in the
+    # decade overload above, but a struct pack/unpack round trip measures
+    # several times slower than math.copysign in CPython.
     negative, x = math.copysign(1.0, x) < 0.0, fractions.Fraction(abs(x))
     if exponent <= 0:
         quarters, rest = divmod(4 * 10**-exponent * x, 1)
@@ -5,6 +5,7 @@ Tests for functions in the 'round' module.
 import decimal
 import fractions
 import math
+import sys
 import unittest
 
 from rounder import (
@@ -39,21 +40,33 @@ from rounder import (
 
 #: A selection of IEEE 754 binary64 floating-point values used in a wide
 #: variety of tests.
-ALL_POSITIVE_TEST_VALUES = [
+ALL_POSITIVE_TEST_VALUES = (
     *[0.25 * n for n in range(100)],  # quarter integers from 0.0 to 24.75
     4503599627370495.5,  # largest representable non-integral half integer
-    float.fromhex("0x0.0000000000001p-1022"),  # smallest +ve subnormal
-    float.fromhex("0x0.fffffffffffffp-1022"),  # largest +ve subnormal
-    float.fromhex("0x1.fffffffffffffp-2"),  # largest value < 0.5
-    float.fromhex("0x1.0000000000001p-1"),  # largest value > 0.5
-    float.fromhex("0x1.fffffffffffffp+1023"),  # largest finite value
-]
+    5e-324,  # smallest +ve subnormal (0x0.0000000000001p-1022)
+    2.225073858507201e-308,  # largest +ve subnormal (0x0.fffffffffffffp-1022)
+    0.49999999999999994,  # largest value < 0.5 (0x1.fffffffffffffp-2)
+    0.5000000000000001,  # largest value > 0.5 (0x1.0000000000001p-1)
+    1.7976931348623157e+308,  # largest finite value (0x1.fffffffffffffp+1023)
+)
 
-ALL_TEST_VALUES = [
-    signed_value
-    for value in ALL_POSITIVE_TEST_VALUES
-    for signed_value in [-value, value]
-]
+#: The negations of the positive test values, followed by the values
+#: themselves.
+ALL_TEST_VALUES = (
+    tuple(-value for value in ALL_POSITIVE_TEST_VALUES) + ALL_POSITIVE_TEST_VALUES
+)
+
+#: Test values for which rounding differences can be computed exactly in
+#: float arithmetic: the value and its rounded result are both multiples
+#: of 0.25, so any difference of magnitude at most 1 is representable.
+QUARTER_TEST_VALUES = tuple(value for value in ALL_TEST_VALUES if value % 0.25 == 0.0)
+
+#: The remaining test values (subnormals and the closest neighbours of 0.5),
+#: for which float subtraction can round a difference that exceeds a bound
+#: down to the bound itself, hiding a violation.
+NON_QUARTER_TEST_VALUES = tuple(
+    value for value in ALL_TEST_VALUES if value % 0.25 != 0.0
+)
 
 
 #: Pairs (e, x) where x is a float and e is the decade of that float;
@@ -61,29 +74,37 @@ ALL_TEST_VALUES = [
 TEN = fractions.Fraction(10)
 
 DECADE_STARTS = []
-for e in range(-324, 309):
-    try:
-        x = float(TEN**e)
-    except OverflowError:
-        x = math.inf
-    if x < TEN**e:
+DECADE_ENDS = []
+# Largest finite float, as a Fraction; powers of ten beyond this bound would
+# make float() raise OverflowError, so compare first instead of catching.
+_MAX_FLOAT = fractions.Fraction(sys.float_info.max)
+# Decades range from that of the smallest positive subnormal (5e-324) up to
+# the decade of the largest finite float. (sys.float_info.min_10_exp is of no
+# use for the lower bound: it describes the smallest *normal* value.)
+_MIN_DECADE = -324
+_MAX_DECADE = sys.float_info.max_10_exp
+# Build both tables in a single pass, keeping a running pair of powers of
+# ten so that each (expensive) Fraction power is computed exactly once.
+_pow_hi = TEN**_MIN_DECADE
+for e in range(_MIN_DECADE, _MAX_DECADE + 1):
+    _pow_lo, _pow_hi = _pow_hi, _pow_hi * TEN
+
+    x = float(_pow_lo) if _pow_lo <= _MAX_FLOAT else math.inf
+    if x < _pow_lo:
         x = math.nextafter(x, math.inf)
 
-    assert TEN**e <= x < TEN ** (e + 1)
-    assert not (TEN**e <= math.nextafter(x, 0.0) < TEN ** (e + 1))
+    if __debug__:
+        assert _pow_lo <= x < _pow_hi
+        assert not (_pow_lo <= math.nextafter(x, 0.0) < _pow_hi)
     DECADE_STARTS.append((e, x))
 
-DECADE_ENDS = []
-for e in range(-324, 309):
-    try:
-        x = float(TEN ** (e + 1))
-    except OverflowError:
-        x = math.inf
-    if x >= TEN ** (e + 1):
+    x = float(_pow_hi) if _pow_hi <= _MAX_FLOAT else math.inf
+    if x >= _pow_hi:
         x = math.nextafter(x, 0.0)
 
-    assert TEN**e <= x < TEN ** (e + 1)
-    assert not (TEN**e <= math.nextafter(x, math.inf) < TEN ** (e + 1))
+    if __debug__:
+        assert _pow_lo <= x < _pow_hi
+        assert not (_pow_lo <= math.nextafter(x, math.inf) < _pow_hi)
     DECADE_ENDS.append((e, x))
 
 DECADE_TEST_VALUES = DECADE_STARTS + DECADE_ENDS
@@ -110,341 +131,171 @@ DIRECTED_ROUNDING_FUNCTIONS = [
 
 ALL_ROUNDING_FUNCTIONS = MIDPOINT_ROUNDING_FUNCTIONS + DIRECTED_ROUNDING_FUNCTIONS
 
+#: Quarter-integer inputs shared by the test_round_*_quarters tests,
+#: together with the expected results under each rounding mode.
+QUARTER_INPUTS = (
+    *[-2.0, -1.75, -1.5, -1.25, -1.0, -0.75, -0.5, -0.25, -0.0],
+    *[0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0],
+)
+
+_TIES_TO_AWAY_EXPECTED = (-2, -2, -2, -1, -1, -1, -1, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2)
+_TIES_TO_ZERO_EXPECTED = (-2, -2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2)
+_TIES_TO_EVEN_EXPECTED = (-2, -2, -2, -1, -1, -1, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2, 2)
+_TIES_TO_ODD_EXPECTED = (-2, -2, -1, -1, -1, -1, -1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2)
+_TIES_TO_PLUS_EXPECTED = (-2, -2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2)
+_TIES_TO_MINUS_EXPECTED = (-2, -2, -2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2)
+_TO_AWAY_EXPECTED = (-2, -2, -2, -2, -1, -1, -1, -1, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2)
+_TO_ZERO_EXPECTED = (-2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2)
+_TO_PLUS_EXPECTED = (-2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2)
+_TO_MINUS_EXPECTED = (-2, -2, -2, -2, -1, -1, -1, -1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2)
+_TO_EVEN_EXPECTED = (-2, -2, -2, -2, -1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 2, 2, 2)
+_TO_ODD_EXPECTED = (-2, -1, -1, -1, -1, -1, -1, -1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 2)
+
+
+#: Cases for round_to_figures on Decimal inputs:
+#: tuples (value, figures, mode, expected_result). Values and expected
+#: results are written as strings but parsed to Decimal once, at import.
+ROUND_TO_FIGURES_DECIMAL_CASES = [
+    (decimal.Decimal(value), figures, mode, decimal.Decimal(expected_result))
+    for value, figures, mode, expected_result in [
+        ("1.25", 2, TIES_TO_EVEN, "1.2"),
+        ("1.25", 3, TIES_TO_EVEN, "1.25"),
+        ("1.25", 4, TIES_TO_EVEN, "1.250"),
+        ("9.9999", 4, TIES_TO_EVEN, "10.00"),
+        # Should be able to handle huge decimal instances without problems.
+        # This double checks that we're not using to-fraction fallbacks.
+        ("1e9999999999", 4, TIES_TO_EVEN, "1.000e9999999999"),
+        # Also check values with more digits than the context precision,
+        # to double check that we're not losing digits (e.g., by doing abs).
+        # We shouldn't be making any use of the local context.
+        # Might also want to add some tests with the context deliberately
+        # set to something odd (rounding mode, precision, emin, emax) to
+        # make sure that the context isn't being used.
+        ("1" * 100, 100, TIES_TO_EVEN, "1" * 100),
+        ("0", 5, TIES_TO_EVEN, "0.0000E+0"),
+    ]
+]
+
+#: Cases for round_to_figures on float inputs under the various
+#: ties-resolving modes: tuples (value, figures, mode, expected_result).
+ROUND_TO_FIGURES_FLOAT_CASES = [
+    (1.25, 2, TIES_TO_EVEN, 1.2),
+    (1.75, 2, TIES_TO_EVEN, 1.8),
+    (-1.25, 2, TIES_TO_EVEN, -1.2),
+    (-1.75, 2, TIES_TO_EVEN, -1.8),
+    (1.25, 2, TIES_TO_ODD, 1.3),
+    (1.75, 2, TIES_TO_ODD, 1.7),
+    (-1.25, 2, TIES_TO_ODD, -1.3),
+    (-1.75, 2, TIES_TO_ODD, -1.7),
+    (1.25, 2, TIES_TO_AWAY, 1.3),
+    (1.75, 2, TIES_TO_AWAY, 1.8),
+    (-1.25, 2, TIES_TO_AWAY, -1.3),
+    (-1.75, 2, TIES_TO_AWAY, -1.8),
+    (1.25, 2, TIES_TO_ZERO, 1.2),
+    (1.75, 2, TIES_TO_ZERO, 1.7),
+    (-1.25, 2, TIES_TO_ZERO, -1.2),
+    (-1.75, 2, TIES_TO_ZERO, -1.7),
+    (1.25, 2, TIES_TO_PLUS, 1.3),
+    (1.75, 2, TIES_TO_PLUS, 1.8),
+    (-1.25, 2, TIES_TO_PLUS, -1.2),
+    (-1.75, 2, TIES_TO_PLUS, -1.7),
+    (1.25, 2, TIES_TO_MINUS, 1.2),
+    (1.75, 2, TIES_TO_MINUS, 1.7),
+    (-1.25, 2, TIES_TO_MINUS, -1.3),
+    (-1.75, 2, TIES_TO_MINUS, -1.8),
+    (math.nan, 2, TIES_TO_EVEN, math.nan),
+    (math.inf, 2, TIES_TO_EVEN, math.inf),
+    (-math.inf, 2, TIES_TO_EVEN, -math.inf),
+]
+
 
 class TestRound(unittest.TestCase):
     def test_round_ties_to_away_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_away(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_away, _TIES_TO_AWAY_EXPECTED)
 
     def test_round_ties_to_zero_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_zero(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_zero, _TIES_TO_ZERO_EXPECTED)
 
     def test_round_ties_to_even_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_even(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_even, _TIES_TO_EVEN_EXPECTED)
 
     def test_round_ties_to_odd_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_odd(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_odd, _TIES_TO_ODD_EXPECTED)
 
     def test_round_ties_to_plus_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_plus(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_plus, _TIES_TO_PLUS_EXPECTED)
 
     def test_round_ties_to_minus_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_ties_to_minus(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_ties_to_minus, _TIES_TO_MINUS_EXPECTED)
 
     def test_round_to_away_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -2),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, -1),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 1),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 2),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_away(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_to_away, _TO_AWAY_EXPECTED)
 
     def test_round_to_zero_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -1),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, 0),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 0),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 1),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_zero(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_to_zero, _TO_ZERO_EXPECTED)
 
     def test_round_to_plus_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -1),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, 0),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 1),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 2),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_plus(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_to_plus, _TO_PLUS_EXPECTED)
 
     def test_round_to_minus_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -2),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, -1),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 0),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 1),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_minus(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_to_minus, _TO_MINUS_EXPECTED)
 
     def test_round_to_even_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -2),
-            (-1.5, -2),
-            (-1.25, -2),
-            (-1.0, -1),
-            (-0.75, 0),
-            (-0.5, 0),
-            (-0.25, 0),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 0),
-            (0.5, 0),
-            (0.75, 0),
-            (1.0, 1),
-            (1.25, 2),
-            (1.5, 2),
-            (1.75, 2),
-            (2.0, 2),
-        ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_even(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self._check_quarters(round_to_even, _TO_EVEN_EXPECTED)
 
     def test_round_to_odd_quarters(self):
-        test_cases = [
-            (-2.0, -2),
-            (-1.75, -1),
-            (-1.5, -1),
-            (-1.25, -1),
-            (-1.0, -1),
-            (-0.75, -1),
-            (-0.5, -1),
-            (-0.25, -1),
-            (-0.0, 0),
-            (0.0, 0),
-            (0.25, 1),
-            (0.5, 1),
-            (0.75, 1),
-            (1.0, 1),
-            (1.25, 1),
-            (1.5, 1),
-            (1.75, 1),
-            (2.0, 2),
+        self._check_quarters(round_to_odd, _TO_ODD_EXPECTED)
+
+    def _check_quarters(self, round_function, expected_results):
+        # Compute all results up front and compare with a single assertion;
+        # on failure, the list diff pinpoints the offending entries. Results
+        # that compare equal but have the wrong type (2.0 rather than 2) are
+        # caught by the bulk type check.
+        actual_results = [round_function(value) for value in QUARTER_INPUTS]
+        self.assertSequenceEqual(actual_results, expected_results)
+        non_int_results = [
+            result for result in actual_results if type(result) is not int
         ]
-        for value, expected_result in test_cases:
-            with self.subTest(value=value):
-                actual_result = round_to_odd(value)
-                self.assertIntsIdentical(actual_result, expected_result)
+        self.assertListEqual(non_int_results, [])
+
+    def _check_round_to_figures_cases(self, test_cases, assert_identical):
+        # Failure context comes from the assertion message rather than a
+        # per-case subTest, which would cost more than the checks themselves.
+        for case in test_cases:
+            value, figures, mode, expected_result = case
+            assert_identical(
+                round_to_figures(value, figures, mode=mode),
+                expected_result,
+                msg=case,
+            )
 
     def test_all_midpoint_rounding_modes_round_to_nearest(self):
         # Difference between rounded value and original value should always
         # at most 0.5 in absolute value.
-        for round_function in MIDPOINT_ROUNDING_FUNCTIONS:
-            for original_value in ALL_TEST_VALUES:
-                rounded_value = round_function(original_value)
-                diff = fractions.Fraction(rounded_value) - fractions.Fraction(
-                    original_value
-                )
-                self.assertLessEqual(abs(diff), fractions.Fraction(1, 2))
+        self._check_max_rounding_difference(MIDPOINT_ROUNDING_FUNCTIONS, 0.5)
 
     def test_all_rounding_modes_round_to_neighbour(self):
         # Difference between rounded value and original value should always
         # be strictly less than 1.0 in absolute value.
-        for round_function in ALL_ROUNDING_FUNCTIONS:
-            for original_value in ALL_TEST_VALUES:
-                rounded_value = round_function(original_value)
-                diff = fractions.Fraction(rounded_value) - fractions.Fraction(
-                    original_value
-                )
-                self.assertLessEqual(abs(diff), 1)
+        self._check_max_rounding_difference(ALL_ROUNDING_FUNCTIONS, 1.0)
+
+    def _check_max_rounding_difference(self, round_functions, bound):
+        # Float arithmetic suffices for the quarter-integer values, but the
+        # boundary values need exact Fraction arithmetic: for example, the
+        # true difference for round_to_odd(0.49999999999999994) is
+        # 0.5 + 2**-54, which float subtraction rounds to exactly 0.5.
+        Fraction = fractions.Fraction
+        exact_bound = Fraction(bound)
+        for round_function in round_functions:
+            max_diff = max(
+                abs(round_function(value) - value) for value in QUARTER_TEST_VALUES
+            )
+            self.assertLessEqual(max_diff, bound, round_function)
+            max_exact_diff = max(
+                abs(Fraction(round_function(value)) - Fraction(value))
+                for value in NON_QUARTER_TEST_VALUES
+            )
+            self.assertLessEqual(max_exact_diff, exact_bound, round_function)
 
     def test_infinities(self):
         for round_function in ALL_ROUNDING_FUNCTIONS:
@@ -472,55 +323,60 @@ class TestRound(unittest.TestCase):
         self.assertFloatsIdentical(round_ties_to_away(-0.0, 1), -0.0)
 
     def test_exact_halfway_cases(self):
-        self.assertFloatsIdentical(round_ties_to_zero(2.5, 0), 2.0)
-        self.assertFloatsIdentical(round_ties_to_away(2.5, 0), 3.0)
-        self.assertFloatsIdentical(round_ties_to_plus(2.5, 0), 3.0)
-        self.assertFloatsIdentical(round_ties_to_minus(2.5, 0), 2.0)
-        self.assertFloatsIdentical(round_ties_to_even(2.5, 0), 2.0)
-        self.assertFloatsIdentical(round_ties_to_odd(2.5, 0), 3.0)
-
-        self.assertFloatsIdentical(round_ties_to_zero(3.5, 0), 3.0)
-        self.assertFloatsIdentical(round_ties_to_away(3.5, 0), 4.0)
-        self.assertFloatsIdentical(round_ties_to_plus(3.5, 0), 4.0)
-        self.assertFloatsIdentical(round_ties_to_minus(3.5, 0), 3.0)
-        self.assertFloatsIdentical(round_ties_to_even(3.5, 0), 4.0)
-        self.assertFloatsIdentical(round_ties_to_odd(3.5, 0), 3.0)
-
-        self.assertFloatsIdentical(round_ties_to_zero(-2.5, 0), -2.0)
-        self.assertFloatsIdentical(round_ties_to_away(-2.5, 0), -3.0)
-        self.assertFloatsIdentical(round_ties_to_plus(-2.5, 0), -2.0)
-        self.assertFloatsIdentical(round_ties_to_minus(-2.5, 0), -3.0)
-        self.assertFloatsIdentical(round_ties_to_even(-2.5, 0), -2.0)
-        self.assertFloatsIdentical(round_ties_to_odd(-2.5, 0), -3.0)
-
-        self.assertFloatsIdentical(round_ties_to_zero(-3.5, 0), -3.0)
-        self.assertFloatsIdentical(round_ties_to_away(-3.5, 0), -4.0)
-        self.assertFloatsIdentical(round_ties_to_plus(-3.5, 0), -3.0)
-        self.assertFloatsIdentical(round_ties_to_minus(-3.5, 0), -4.0)
-        self.assertFloatsIdentical(round_ties_to_even(-3.5, 0), -4.0)
-        self.assertFloatsIdentical(round_ties_to_odd(-3.5, 0), -3.0)
+        # For each input, expected results in the order of the functions
+        # tuple below.
+        halfway_functions = (
+            round_ties_to_zero,
+            round_ties_to_away,
+            round_ties_to_plus,
+            round_ties_to_minus,
+            round_ties_to_even,
+            round_ties_to_odd,
+        )
+        test_cases = [
+            (2.5, (2.0, 3.0, 3.0, 2.0, 2.0, 3.0)),
+            (3.5, (3.0, 4.0, 4.0, 3.0, 4.0, 3.0)),
+            (-2.5, (-2.0, -3.0, -2.0, -3.0, -2.0, -3.0)),
+            (-3.5, (-3.0, -4.0, -3.0, -4.0, -4.0, -3.0)),
+        ]
+        for value, expected_results in test_cases:
+            for round_function, expected_result in zip(
+                halfway_functions, expected_results
+            ):
+                self.assertFloatsIdentical(
+                    round_function(value, 0),
+                    expected_result,
+                    msg=(round_function, value),
+                )
 
     def test_special_floats(self):
         for rounding_function in ALL_ROUNDING_FUNCTIONS:
-            with self.subTest(rounding_function=rounding_function):
-                self.assertFloatsIdentical(rounding_function(math.nan, 0), math.nan)
-                self.assertFloatsIdentical(rounding_function(math.inf, 0), math.inf)
-                self.assertFloatsIdentical(rounding_function(-math.inf, 0), -math.inf)
+            self.assertFloatsIdentical(
+                rounding_function(math.nan, 0), math.nan, msg=rounding_function
+            )
+            self.assertFloatsIdentical(
+                rounding_function(math.inf, 0), math.inf, msg=rounding_function
+            )
+            self.assertFloatsIdentical(
+                rounding_function(-math.inf, 0), -math.inf, msg=rounding_function
+            )
 
     def test_round_finite_to_overflow(self):
         for rounding_function in MIDPOINT_ROUNDING_FUNCTIONS:
-            with self.subTest(rounding_function=rounding_function):
-                with self.assertRaises(OverflowError):
-                    rounding_function(1.7e308, -308)
-                with self.assertRaises(OverflowError):
-                    rounding_function(-1.7e308, -308)
+            with self.assertRaises(OverflowError, msg=rounding_function):
+                rounding_function(1.7e308, -308)
+            with self.assertRaises(OverflowError, msg=rounding_function):
+                rounding_function(-1.7e308, -308)
 
     def test_round_integers_places_none(self):
         test_values = [*range(-10, 10), *range(10**100 - 10, 10**100 + 10)]
         for rounding_function in MIDPOINT_ROUNDING_FUNCTIONS:
-            for value in test_values:
-                rounded_value = rounding_function(value)
-                self.assertIntsIdentical(rounded_value, value)
+            rounded_values = [rounding_function(value) for value in test_values]
+            self.assertListEqual(rounded_values, test_values)
+            non_int_results = [
+                result for result in rounded_values if type(result) is not int
+            ]
+            self.assertListEqual(non_int_results, [])
 
     def test_round_integers_places_not_none(self):
         self.assertIntsIdentical(round_ties_to_even(123456, 1000), 123456)
@@ -623,24 +479,47 @@ class TestRound(unittest.TestCase):
         # Let's just try all the corner cases and see what happens. We'll compute
         # the smallest and the largest representable float in each decade.
 
-        # Check extremes of each float decade.
+        # Check extremes of each float decade. Collect all results first and
+        # compare with a single assertion: per-case subTest and assertion
+        # machinery would otherwise dominate the runtime of this test.
+        copysign, inf = math.copysign, math.inf
+        params = []
+        actual_results = []
+        expected_results = []
         for e, x in DECADE_TEST_VALUES:
+            overflow_result = copysign(inf, x)
             # 10**e <= x < 10**(e + 1),
             # so if we want to round to 'figures' figures,
             # want to round to a multiple of 10**(e + 1 - figures)
+
+            # An OverflowError on either side is mapped to an infinity
+            # sentinel so that the two sides stay directly comparable.
+            # (The overflowing values of 'figures' are not contiguous - for
+            # the top decade, rounding to 10 figures overflows while
+            # rounding to 9 does not - so each case must be tried afresh.)
             for figures in range(1, 20):
+                try:
+                    actual_result = round_to_figures(x, figures)
+                except OverflowError:
+                    actual_result = overflow_result
+
+                try:
+                    expected_result = round_ties_to_even(x, figures - e - 1)
+                except OverflowError:
+                    expected_result = overflow_result
+
+                params.append((e, x, figures))
+                actual_results.append(actual_result)
+                expected_results.append(expected_result)
+
+        if actual_results != expected_results:
+            # Slow path, taken only on failure: locate the offending cases.
+            for (e, x, figures), actual_result, expected_result in zip(
+                params, actual_results, expected_results
+            ):
                 with self.subTest(e=e, x=x, figures=figures):
-                    try:
-                        actual_result = round_to_figures(x, figures)
-                    except OverflowError:
-                        actual_result = math.copysign(math.inf, x)
-
-                    try:
-                        expected_result = round_ties_to_even(x, figures - e - 1)
-                    except OverflowError:
-                        expected_result = math.copysign(math.inf, x)
-
                     self.assertFloatsIdentical(actual_result, expected_result)
+        self.assertEqual(actual_results, expected_results)
 
     def test_round_to_figures_ints(self):
         self.assertIntsIdentical(round_to_figures(12345, 1), 10000)
@@ -673,89 +552,31 @@ class TestRound(unittest.TestCase):
             ("4/37", 2, TIES_TO_EVEN, "0.11"),
         ]
 
+        Fraction = fractions.Fraction
         for case in test_cases:
-            with self.subTest(case=case):
-                value, figures, mode, expected_result = case
-                value = fractions.Fraction(value)
-                expected_result = fractions.Fraction(expected_result)
-                self.assertFractionsIdentical(
-                    round_to_figures(value, figures, mode=mode),
-                    expected_result,
-                )
-                self.assertFractionsIdentical(
-                    round_to_figures(-value, figures, mode=mode),
-                    -expected_result,
-                )
+            value, figures, mode, expected_result = case
+            value = Fraction(value)
+            expected_result = Fraction(expected_result)
+            self.assertFractionsIdentical(
+                round_to_figures(value, figures, mode=mode),
+                expected_result,
+                msg=case,
+            )
+            self.assertFractionsIdentical(
+                round_to_figures(-value, figures, mode=mode),
+                -expected_result,
+                msg=case,
+            )
 
     def test_round_to_figures_decimals(self):
-        # Tuples (value-as-string, figures, mode, expected_result-as-string)
-        test_cases = [
-            ("1.25", 2, TIES_TO_EVEN, "1.2"),
-            ("1.25", 3, TIES_TO_EVEN, "1.25"),
-            ("1.25", 4, TIES_TO_EVEN, "1.250"),
-            ("9.9999", 4, TIES_TO_EVEN, "10.00"),
-            # Should be able to handle huge decimal instances without problems.
-            # This double checks that we're not using to-fraction fallbacks.
-            ("1e9999999999", 4, TIES_TO_EVEN, "1.000e9999999999"),
-            # Also check values with more digits than the context precision,
-            # to double check that we're not losing digits (e.g., by doing abs).
-            # We shouldn't be making any use of the local context.
-            # Might also want to add some tests with the context deliberately
-            # set to something odd (rounding mode, precision, emin, emax) to
-            # make sure that the context isn't being used.
-            ("1" * 100, 100, TIES_TO_EVEN, "1" * 100),
-            ("0", 5, TIES_TO_EVEN, "0.0000E+0"),
-        ]
-
-        for case in test_cases:
-            with self.subTest(case=case):
-                value, figures, mode, expected_result = case
-                value = decimal.Decimal(value)
-                expected_result = decimal.Decimal(expected_result)
-                self.assertDecimalsIdentical(
-                    round_to_figures(value, figures, mode=mode),
-                    expected_result,
-                )
+        self._check_round_to_figures_cases(
+            ROUND_TO_FIGURES_DECIMAL_CASES, self.assertDecimalsIdentical
+        )
 
     def test_round_to_figures_other_rounding_modes(self):
-        # Tuples (value, figures, mode, expected_result)
-        test_cases = [
-            (1.25, 2, TIES_TO_EVEN, 1.2),
-            (1.75, 2, TIES_TO_EVEN, 1.8),
-            (-1.25, 2, TIES_TO_EVEN, -1.2),
-            (-1.75, 2, TIES_TO_EVEN, -1.8),
-            (1.25, 2, TIES_TO_ODD, 1.3),
-            (1.75, 2, TIES_TO_ODD, 1.7),
-            (-1.25, 2, TIES_TO_ODD, -1.3),
-            (-1.75, 2, TIES_TO_ODD, -1.7),
-            (1.25, 2, TIES_TO_AWAY, 1.3),
-            (1.75, 2, TIES_TO_AWAY, 1.8),
-            (-1.25, 2, TIES_TO_AWAY, -1.3),
-            (-1.75, 2, TIES_TO_AWAY, -1.8),
-            (1.25, 2, TIES_TO_ZERO, 1.2),
-            (1.75, 2, TIES_TO_ZERO, 1.7),
-            (-1.25, 2, TIES_TO_ZERO, -1.2),
-            (-1.75, 2, TIES_TO_ZERO, -1.7),
-            (1.25, 2, TIES_TO_PLUS, 1.3),
-            (1.75, 2, TIES_TO_PLUS, 1.8),
-            (-1.25, 2, TIES_TO_PLUS, -1.2),
-            (-1.75, 2, TIES_TO_PLUS, -1.7),
-            (1.25, 2, TIES_TO_MINUS, 1.2),
-            (1.75, 2, TIES_TO_MINUS, 1.7),
-            (-1.25, 2, TIES_TO_MINUS, -1.3),
-            (-1.75, 2, TIES_TO_MINUS, -1.8),
-            (math.nan, 2, TIES_TO_EVEN, math.nan),
-            (math.inf, 2, TIES_TO_EVEN, math.inf),
-            (-math.inf, 2, TIES_TO_EVEN, -math.inf),
-        ]
-
-        for case in test_cases:
-            with self.subTest(case=case):
-                value, figures, mode, expected_result = case
-                self.assertFloatsIdentical(
-                    round_to_figures(value, figures, mode=mode),
-                    expected_result,
-                )
+        self._check_round_to_figures_cases(
+            ROUND_TO_FIGURES_FLOAT_CASES, self.assertFloatsIdentical
+        )
 
     def test_round_to_places_float(self):
         # Tuples (value, places, mode, expected_result)
@@ -835,12 +656,12 @@ class TestRound(unittest.TestCase):
         ]
 
         for case in test_cases:
-            with self.subTest(case=case):
-                value, places, mode, expected_result = case
-                self.assertFloatsIdentical(
-                    round_to_places(value, places, mode=mode),
-                    expected_result,
-                )
+            value, places, mode, expected_result = case
+            self.assertFloatsIdentical(
+                round_to_places(value, places, mode=mode),
+                expected_result,
+                msg=case,
+            )
 
     def test_round_to_zero_05_away(self):
         test_cases = [
@@ -867,27 +688,46 @@ class TestRound(unittest.TestCase):
             (9.8, 9),
         ]
 
-        for case in test_cases:
-            value, expected_result = case
-            with self.subTest(case=case):
-                self.assertEqual(round_to_zero_05_away(value), expected_result)
-
-    def assertIntsIdentical(self, first, second):
-        self.assertEqual(type(first), int)
-        self.assertEqual(type(second), int)
-        self.assertEqual(first, second)
-
-    def assertFractionsIdentical(self, first, second):
-        self.assertEqual(type(first), fractions.Fraction)
-        self.assertEqual(type(second), fractions.Fraction)
-        self.assertEqual(first, second)
-
-    def assertFloatsIdentical(self, first, second):
-        self.assertEqual(type(first), float)
-        self.assertEqual(type(second), float)
-        self.assertEqual(str(first), str(second))
-
-    def assertDecimalsIdentical(self, first, second):
-        self.assertEqual(type(first), decimal.Decimal)
-        self.assertEqual(type(second), decimal.Decimal)
-        self.assertEqual(str(first), str(second))
+        for value, expected_result in test_cases:
+            self.assertEqual(round_to_zero_05_away(value), expected_result, value)
+
+    # The helpers below are called thousands of times per test run, so they
+    # do a single combined check and only fall back to unittest's failure
+    # machinery on mismatch.
+
+    def assertIntsIdentical(self, first, second, msg=None):
+        if type(first) is int and type(second) is int and first == second:
+            return
+        standard_msg = f"{first!r} and {second!r} are not identical ints"
+        self.fail(self._formatMessage(msg, standard_msg))
+
+    def assertFractionsIdentical(self, first, second, msg=None):
+        if (
+            type(first) is fractions.Fraction
+            and type(second) is fractions.Fraction
+            and first == second
+        ):
+            return
+        standard_msg = f"{first!r} and {second!r} are not identical fractions"
+        self.fail(self._formatMessage(msg, standard_msg))
+
+    def assertFloatsIdentical(self, first, second, msg=None):
+        # str comparison distinguishes signed zeros and matches nans.
+        if (
+            type(first) is float
+            and type(second) is float
+            and str(first) == str(second)
+        ):
+            return
+        standard_msg = f"{first!r} and {second!r} are not identical floats"
+        self.fail(self._formatMessage(msg, standard_msg))
+
+    def assertDecimalsIdentical(self, first, second, msg=None):
+        if (
+            type(first) is decimal.Decimal
+            and type(second) is decimal.Decimal
+            and str(first) == str(second)
+        ):
+            return
+        standard_msg = f"{first!r} and {second!r} are not identical decimals"
+        self.fail(self._formatMessage(msg, standard_msg))